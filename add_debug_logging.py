@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
+from scripts._editor import edit_bytes
+from scripts._paths import QUESTCHAIN_TS
 
-file_path = r'C:\TrinityBots\trinitycore-mcp\src\tools\questchain.ts'
-
-# Read file
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+file_path = QUESTCHAIN_TS
 
 # Add debug logging after the starters query
 old_code = """  const starters = await queryWorld(query, [zoneId]);
@@ -24,10 +22,12 @@ new_code = """  const starters = await queryWorld(query, [zoneId]);
 
   for (const starter of starters) {"""
 
-content = content.replace(old_code, new_code)
-
-# Write back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
+# Both blocks are pure ASCII, so the replace can run on raw bytes and skip
+# the UTF-8 decode/encode passes over the whole file
+OLD_CODE = old_code.encode('ascii')
+NEW_CODE = new_code.encode('ascii')
 
-print("SUCCESS: Added debug logging to questchain.ts")
+if edit_bytes(file_path, lambda data: data.replace(OLD_CODE, NEW_CODE)):
+    print("SUCCESS: Added debug logging to questchain.ts")
+else:
+    print("NO-OP: already applied, nothing to write")
@@ -1,12 +1,10 @@
 #!/usr/bin/env python3
+from scripts._editor import edit_bytes
+from scripts._paths import QUESTCHAIN_TS
 
-file_path = r'C:\TrinityBots\trinitycore-mcp\src\tools\questchain.ts'
+file_path = QUESTCHAIN_TS
 
-# Read file
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Add zone boundaries configuration after the imports
+# Zone boundaries configuration inserted after the imports
 zone_boundaries = """
 // ============================================================================
 // ZONE BOUNDARY DEFINITIONS
@@ -37,13 +35,13 @@ const ZONE_BOUNDARIES: Record<number, ZoneBoundary> = {
 
 """
 
-# Insert after the imports (before TYPE DEFINITIONS comment)
-content = content.replace(
-    '// ============================================================================\n// TYPE DEFINITIONS',
-    zone_boundaries + '// ============================================================================\n// TYPE DEFINITIONS'
-)
+def apply(data):
+    # Insert after the imports (before TYPE DEFINITIONS comment)
+    data = data.replace(TYPE_ANCHOR, ZONE_BOUNDARIES_BYTES + TYPE_ANCHOR)
+    # Update the findQuestChainsInZone query to include coordinate-based detection
+    return data.replace(OLD_QUERY, NEW_QUERY)
 
-# Now update the findQuestChainsInZone query to include coordinate-based detection
+# findQuestChainsInZone rewrite with coordinate-based detection
 old_query = """export async function findQuestChainsInZone(zoneId: number): Promise<QuestChain[]> {
   // Find all quests in zone that are potential chain starters
   // Removed NextQuestID requirement - many chains only use PrevQuestID
@@ -94,10 +92,14 @@ new_query = """export async function findQuestChainsInZone(zoneId: number): Prom
 
   const starters = await queryWorld(query, [zoneId]);"""
 
-content = content.replace(old_query, new_query)
-
-# Write back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("SUCCESS: Added zone boundary detection for coordinate-based quest finding")
+# The inserted blocks are pure ASCII, so the edits can run on raw bytes and
+# skip the UTF-8 decode/encode passes over the whole file
+TYPE_ANCHOR = b'// ============================================================================\n// TYPE DEFINITIONS'
+ZONE_BOUNDARIES_BYTES = zone_boundaries.encode('ascii')
+OLD_QUERY = old_query.encode('ascii')
+NEW_QUERY = new_query.encode('ascii')
+
+if edit_bytes(file_path, apply):
+    print("SUCCESS: Added zone boundary detection for coordinate-based quest finding")
+else:
+    print("NO-OP: already applied, nothing to write")
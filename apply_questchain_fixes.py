@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Apply every questchain.ts fix in a single read/write cycle.
+
+Fuses the edits from fix_questtitle.py, fix_quest_levels.py,
+fix_breadcrumb_classes.py, fix_quest_chain_simple.py, fix_chain_tracing.py,
+add_debug_logging.py, add_error_logging.py and add_zone_boundaries.py so the
+file is read once, patched in memory, and written once, instead of one
+read/write round trip per script.
+"""
+
+from scripts._editor import edit_text
+from scripts._paths import QUESTCHAIN_TS
+
+file_path = QUESTCHAIN_TS
+
+# --- fix_chain_tracing.py: trace chains via PrevQuestID, not NextQuestID ---
+
+CHAIN_TRACING_OLD = """    const quest = results[0];
+    nodes.push({
+      ...quest,
+      depth
+    });
+
+    currentQuestId = quest.nextQuest && quest.nextQuest !== 0 ? quest.nextQuest : null;
+    depth++;
+  }"""
+
+CHAIN_TRACING_NEW = """    const quest = results[0];
+    nodes.push({
+      ...quest,
+      depth
+    });
+
+    // TrinityCore chains use PrevQuestID (backwards), not NextQuestID (always 0)
+    // Find the next quest that has the current quest as its prerequisite
+    const nextQuery = `
+      SELECT ID
+      FROM quest_template_addon
+      WHERE PrevQuestID = ?
+      LIMIT 1
+    `;
+    const nextResults = await queryWorld(nextQuery, [currentQuestId]);
+    currentQuestId = nextResults && nextResults.length > 0 ? nextResults[0].ID : null;
+    depth++;
+  }"""
+
+# --- add_debug_logging.py: log starter counts after the starters query ---
+
+DEBUG_LOGGING_OLD = """  const starters = await queryWorld(query, [zoneId]);
+
+  const chains: QuestChain[] = [];
+
+  for (const starter of starters) {"""
+
+DEBUG_LOGGING_NEW = """  const starters = await queryWorld(query, [zoneId]);
+
+  console.log(`[DEBUG] findQuestChainsInZone(${zoneId}): Found ${starters.length} starter quests`);
+  if (starters.length > 0 && starters.length <= 5) {
+    console.log('[DEBUG] Starter quest IDs:', starters.map((s: any) => s.ID));
+  }
+
+  const chains: QuestChain[] = [];
+
+  for (const starter of starters) {"""
+
+# --- add_error_logging.py: log why a chain trace was skipped ---
+
+ERROR_LOGGING_OLD = """    } catch (error) {
+      // Skip invalid chains
+      continue;
+    }"""
+
+ERROR_LOGGING_NEW = """    } catch (error) {
+      // Skip invalid chains
+      console.log(`[DEBUG] Failed to trace chain for quest ${starter.ID}:`, error instanceof Error ? error.message : String(error));
+      continue;
+    }"""
+
+# --- add_zone_boundaries.py: coordinate-based zone detection fallback ---
+
+ZONE_BOUNDARIES_BLOCK = """
+// ============================================================================
+// ZONE BOUNDARY DEFINITIONS
+// ============================================================================
+
+/**
+ * Zone boundaries for coordinate-based detection
+ * Fallback for creatures with incorrect/missing zoneId
+ */
+interface ZoneBoundary {
+  map: number;
+  minX: number;
+  maxX: number;
+  minY: number;
+  maxY: number;
+}
+
+const ZONE_BOUNDARIES: Record<number, ZoneBoundary> = {
+  12: { // Elwynn Forest (includes Northshire Abbey)
+    map: 0, // Eastern Kingdoms
+    minX: -9500,
+    maxX: -8700,
+    minY: -250,
+    maxY: 500
+  }
+  // Add more zones as needed
+};
+
+"""
+
+ZONE_QUERY_OLD = """export async function findQuestChainsInZone(zoneId: number): Promise<QuestChain[]> {
+  // Find all quests in zone that are potential chain starters
+  // Removed NextQuestID requirement - many chains only use PrevQuestID
+  const query = `
+    SELECT DISTINCT qt.ID
+    FROM quest_template qt
+    LEFT JOIN quest_template_addon qta ON qt.ID = qta.ID
+    INNER JOIN creature_queststarter cqs ON qt.ID = cqs.quest
+    INNER JOIN creature c ON cqs.id = c.id
+    WHERE c.zoneId = ?
+      AND (qta.PrevQuestID = 0 OR qta.PrevQuestID IS NULL)
+    LIMIT 100
+  `;
+
+  const starters = await queryWorld(query, [zoneId]);"""
+
+ZONE_QUERY_NEW = """export async function findQuestChainsInZone(zoneId: number): Promise<QuestChain[]> {
+  // Find all quests in zone that are potential chain starters
+  // Uses both zoneId AND coordinate-based detection as fallback
+  const boundary = ZONE_BOUNDARIES[zoneId];
+
+  let query = `
+    SELECT DISTINCT qt.ID
+    FROM quest_template qt
+    LEFT JOIN quest_template_addon qta ON qt.ID = qta.ID
+    INNER JOIN creature_queststarter cqs ON qt.ID = cqs.quest
+    INNER JOIN creature c ON cqs.id = c.id
+    WHERE (
+      c.zoneId = ?
+  `;
+
+  // Add coordinate-based detection if boundary is defined
+  if (boundary) {
+    query += `
+      OR (
+        c.map = ${boundary.map}
+        AND c.position_x BETWEEN ${boundary.minX} AND ${boundary.maxX}
+        AND c.position_y BETWEEN ${boundary.minY} AND ${boundary.maxY}
+      )
+    `;
+  }
+
+  query += `
+    )
+    AND (qta.PrevQuestID = 0 OR qta.PrevQuestID IS NULL)
+    LIMIT 100
+  `;
+
+  const starters = await queryWorld(query, [zoneId]);"""
+
+# All edits, in the order the individual scripts were applied. Later pairs
+# may depend on the text produced by earlier ones (e.g. the zone-boundary
+# query rewrite matches the comment written by the chain-query fix).
+EDITS = [
+    # fix_questtitle.py: QuestTitle column was renamed LogTitle in 11.2
+    ('QuestTitle', 'LogTitle'),
+
+    # fix_quest_levels.py: MinLevel/QuestLevel live on quest_template_addon
+    ('qt.ID as questId, qt.LogTitle as name, MinLevel as minLevel, MaxLevel as maxLevel,',
+     'qt.ID as questId, qt.LogTitle as name, qta.MaxLevel as minLevel, qta.MaxLevel as maxLevel,'),
+    ('qt.QuestLevel as questLevel,',
+     'qta.MaxLevel as questLevel,'),
+    ('qt.ID as questId, qt.LogTitle as name, qt.QuestLevel as level,',
+     'qt.ID as questId, qt.LogTitle as name, qta.MaxLevel as level,'),
+    ('MIN(qt.MinLevel) as minLevel, MAX(qt.MinLevel) as maxLevel',
+     'MIN(qta.MaxLevel) as minLevel, MAX(qta.MaxLevel) as maxLevel'),
+    ('qt.MinLevel, qt.QuestLevel,',
+     'qta.MaxLevel as MinLevel, qta.MaxLevel as QuestLevel,'),
+    ('AND qt.MinLevel <= ?',
+     'AND qta.MaxLevel <= ?'),
+    ('AND qt.QuestLevel <= ? + 5',
+     'AND qta.MaxLevel <= ? + 5'),
+    ('ORDER BY qt.QuestLevel, qt.ID',
+     'ORDER BY qta.MaxLevel, qt.ID'),
+
+    # fix_breadcrumb_classes.py: breadcrumb/class columns come from qta
+    ('qt.BreadcrumbForQuestId as breadcrumbFrom, qt.RequiredClasses as requiredClasses,',
+     'qta.BreadcrumbForQuestId as breadcrumbFrom, qta.AllowableClasses as requiredClasses,'),
+    ('qt.BreadcrumbForQuestId as breadcrumbQuest,',
+     'qta.BreadcrumbForQuestId as breadcrumbQuest,'),
+
+    # fix_quest_chain_simple.py: drop the NextQuestID requirement
+    ('''      AND (qta.PrevQuestID = 0 OR qta.PrevQuestID IS NULL)
+      AND qta.NextQuestID IS NOT NULL
+      AND qta.NextQuestID != 0
+    LIMIT 50''',
+     '''      AND (qta.PrevQuestID = 0 OR qta.PrevQuestID IS NULL)
+    LIMIT 100'''),
+    ('  // Find all quests in zone that are chain starters (no previous quest)',
+     '  // Find all quests in zone that are potential chain starters\n  // Removed NextQuestID requirement - many chains only use PrevQuestID'),
+    ('      if (chain.totalQuests > 1) { // Only include actual chains (2+ quests)',
+     '      // Include all quests, even standalone ones (chains of 1 quest)\n      if (chain.totalQuests >= 1) {'),
+
+    # fix_chain_tracing.py / add_debug_logging.py / add_error_logging.py
+    (CHAIN_TRACING_OLD, CHAIN_TRACING_NEW),
+    (DEBUG_LOGGING_OLD, DEBUG_LOGGING_NEW),
+    (ERROR_LOGGING_OLD, ERROR_LOGGING_NEW),
+
+    # add_zone_boundaries.py: boundary table + coordinate fallback query
+    ('// ============================================================================\n// TYPE DEFINITIONS',
+     ZONE_BOUNDARIES_BLOCK + '// ============================================================================\n// TYPE DEFINITIONS'),
+    (ZONE_QUERY_OLD, ZONE_QUERY_NEW),
+]
+
+def apply_fixes(content):
+    """Run every questchain.ts edit over an in-memory string."""
+    for old, new in EDITS:
+        content = content.replace(old, new)
+    return content
+
+def main():
+    # One read, all edits in memory, one atomic write (skipped when no-op)
+    if edit_text(file_path, apply_fixes):
+        print(f"SUCCESS: Applied all {len(EDITS)} questchain.ts fixes in one pass")
+    else:
+        print("NO-OP: already applied, nothing to write")
+
+if __name__ == '__main__':
+    main()
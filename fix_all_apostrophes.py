@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 
-file_path = r'C:\TrinityBots\trinitycore-mcp\web-ui\app\api\zones\route.ts'
+from scripts._editor import edit_text, multi_replace
+from scripts._paths import ZONES_ROUTE_TS
 
-# Read file
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+file_path = ZONES_ROUTE_TS
 
 # Fix ALL unescaped apostrophes in zone/map names
 replacements = {
@@ -19,11 +18,9 @@ replacements = {
     "'Ahn'kahet: The Old Kingdom'": "'Ahn\\'kahet: The Old Kingdom'",
 }
 
-for old, new in replacements.items():
-    content = content.replace(old, new)
-
-# Write back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("SUCCESS: Fixed all remaining apostrophe escaping issues")
+# Single-pass multi-pattern replace (Aho-Corasick when available); edit_text
+# reads once, writes atomically, and skips the write when nothing changed
+if edit_text(file_path, lambda content: multi_replace(content, replacements)):
+    print("SUCCESS: Fixed all remaining apostrophe escaping issues")
+else:
+    print("NO-OP: already applied, nothing to write")
@@ -1,37 +1,36 @@
 #!/usr/bin/env python3
 import re
 
-file_path = r'C:\TrinityBots\trinitycore-mcp\web-ui\app\api\zones\route.ts'
+from scripts._editor import edit_text
+from scripts._paths import ZONES_ROUTE_TS
 
-# Read file
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+file_path = ZONES_ROUTE_TS
 
 # Find all lines with unescaped apostrophes in zone/map names
 # Pattern: matches lines like "123: 'Name with ' apostrophe',"
 # We need to escape apostrophes that appear INSIDE the string (not the delimiters)
 
+# Matches map/zone entries: "  123: 'Some Name with potential ' apostrophe',"
+_ENTRY_RE = re.compile(r"(\s+\d+): '([^']+(?:'[^']*)*)',")
+
+# Character-level escape table; str.translate beats a regex sub for
+# single-character transforms
+_APOS_TABLE = str.maketrans({"'": "\\'"})
+
 def fix_apostrophes_in_line(match):
     """Fix apostrophes within a map/zone name string"""
-    full_line = match.group(0)
     number = match.group(1)
     name_content = match.group(2)
 
-    # Escape any unescaped apostrophes within the name
-    # Replace ' with \' but avoid replacing already escaped ones
-    fixed_name = name_content.replace("\\'", "ESCAPED_APOSTROPHE_PLACEHOLDER")
-    fixed_name = fixed_name.replace("'", "\\'")
-    fixed_name = fixed_name.replace("ESCAPED_APOSTROPHE_PLACEHOLDER", "\\'")
+    # Shield already-escaped apostrophes with a NUL sentinel, translate the
+    # remaining ones, then restore
+    fixed_name = (name_content.replace("\\'", "\x00")
+                  .translate(_APOS_TABLE)
+                  .replace("\x00", "\\'"))
 
     return f"{number}: '{fixed_name}',"
 
-# Pattern to match map/zone entries: "  123: 'Some Name with potential ' apostrophe',"
-pattern = r"(\s+\d+): '([^']+(?:'[^']*)*)',"
-
-content = re.sub(pattern, fix_apostrophes_in_line, content)
-
-# Write back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("SUCCESS: Fixed all apostrophes using regex pattern matching")
+if edit_text(file_path, lambda content: _ENTRY_RE.sub(fix_apostrophes_in_line, content)):
+    print("SUCCESS: Fixed all apostrophes using regex pattern matching")
+else:
+    print("NO-OP: already applied, nothing to write")
@@ -1,25 +1,20 @@
 #!/usr/bin/env python3
+from scripts._editor import edit_text, multi_replace
+from scripts._paths import QUESTCHAIN_TS
 
-file_path = r'C:\TrinityBots\trinitycore-mcp\src\tools\questchain.ts'
+file_path = QUESTCHAIN_TS
 
-# Read file
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+# Both breadcrumb/class fixes, applied in one fused pass
+EDITS = {
+    # Line 204: qt.BreadcrumbForQuestId and qt.RequiredClasses should be from qta
+    'qt.BreadcrumbForQuestId as breadcrumbFrom, qt.RequiredClasses as requiredClasses,':
+        'qta.BreadcrumbForQuestId as breadcrumbFrom, qta.AllowableClasses as requiredClasses,',
+    # Line 279: qt.BreadcrumbForQuestId should be qta.BreadcrumbForQuestId
+    'qt.BreadcrumbForQuestId as breadcrumbQuest,':
+        'qta.BreadcrumbForQuestId as breadcrumbQuest,',
+}
 
-# Fix Line 204: qt.BreadcrumbForQuestId and qt.RequiredClasses should be from qta
-content = content.replace(
-    'qt.BreadcrumbForQuestId as breadcrumbFrom, qt.RequiredClasses as requiredClasses,',
-    'qta.BreadcrumbForQuestId as breadcrumbFrom, qta.AllowableClasses as requiredClasses,'
-)
-
-# Fix Line 279: qt.BreadcrumbForQuestId should be qta.BreadcrumbForQuestId
-content = content.replace(
-    'qt.BreadcrumbForQuestId as breadcrumbQuest,',
-    'qta.BreadcrumbForQuestId as breadcrumbQuest,'
-)
-
-# Write back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("SUCCESS: Fixed BreadcrumbForQuestId and RequiredClasses references")
+if edit_text(file_path, lambda content: multi_replace(content, EDITS)):
+    print("SUCCESS: Fixed BreadcrumbForQuestId and RequiredClasses references")
+else:
+    print("NO-OP: already applied, nothing to write")
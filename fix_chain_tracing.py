@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
+import sys
 
-file_path = r'C:\TrinityBots\trinitycore-mcp\src\tools\questchain.ts'
+from scripts._editor import edit_bytes
+from scripts._paths import QUESTCHAIN_TS
 
-# Read file
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+file_path = QUESTCHAIN_TS
 
 # Fix the chain tracing logic - TrinityCore uses PrevQuestID (backwards), not NextQuestID
 old_code = """    const quest = results[0];
@@ -36,10 +36,24 @@ new_code = """    const quest = results[0];
     depth++;
   }"""
 
-content = content.replace(old_code, new_code)
-
-# Write back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("SUCCESS: Fixed quest chain tracing to use PrevQuestID instead of NextQuestID")
+# Both blocks are pure ASCII, so the splice can run on raw bytes and skip
+# the UTF-8 decode/encode passes over the whole file
+OLD_CODE = old_code.encode('ascii')
+NEW_CODE = new_code.encode('ascii')
+
+def apply(data):
+    # No-op on re-runs: the patched block carries this marker
+    if b'WHERE PrevQuestID = ?' in data:
+        return data
+
+    # Single-match splice instead of a full-file replace, and fail loudly when
+    # the expected block is missing rather than silently writing nothing
+    idx = data.find(OLD_CODE)
+    if idx < 0:
+        sys.exit("ERROR: chain tracing block not found - has questchain.ts changed?")
+    return data[:idx] + NEW_CODE + data[idx + len(OLD_CODE):]
+
+if edit_bytes(file_path, apply):
+    print("SUCCESS: Fixed quest chain tracing to use PrevQuestID instead of NextQuestID")
+else:
+    print("NO-OP: chain tracing fix already applied")
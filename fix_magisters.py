@@ -1,16 +1,12 @@
 #!/usr/bin/env python3
+from scripts._editor import edit_text
+from scripts._paths import ZONES_ROUTE_TS
 
-file_path = r'C:\TrinityBots\trinitycore-mcp\web-ui\app\api\zones\route.ts'
-
-# Read file
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+file_path = ZONES_ROUTE_TS
 
 # Fix the missing apostrophe
-content = content.replace("'Magisters' Terrace'", "'Magisters\\' Terrace'")
-
-# Write back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("SUCCESS: Fixed Magisters' Terrace apostrophe")
+if edit_text(file_path, lambda content: content.replace(
+        "'Magisters' Terrace'", "'Magisters\\' Terrace'")):
+    print("SUCCESS: Fixed Magisters' Terrace apostrophe")
+else:
+    print("NO-OP: already applied, nothing to write")
@@ -7,51 +7,53 @@ Replaces all SQL column references from QuestLevel to qta.MaxLevel
 import re
 from pathlib import Path
 
+from scripts._paths import TOOLS_DIR
+
 fixes = [
     {
-        'file': r'C:\TrinityBots\trinitycore-mcp\src\tools\dataexplorer.ts',
+        'file': TOOLS_DIR / 'dataexplorer.ts',
         'line': 246,
         'old': 'ID, LogTitle, QuestLevel, MinLevel, QuestType',
         'new': 'qt.ID, qt.LogTitle, qta.MaxLevel as QuestLevel, qt.MinLevel, qt.QuestInfoID as QuestType',
         'note': 'Need to add LEFT JOIN quest_template_addon qta ON qt.ID = qta.ID'
     },
     {
-        'file': r'C:\TrinityBots\trinitycore-mcp\src\tools\quest.ts',
+        'file': TOOLS_DIR / 'quest.ts',
         'line': 34,
         'old': 'QuestLevel as level,',
         'new': 'qta.MaxLevel as level,',
         'note': 'Ensure LEFT JOIN quest_template_addon qta ON qt.ID = qta.ID exists'
     },
     {
-        'file': r'C:\TrinityBots\trinitycore-mcp\src\tools\questmapper.ts',
+        'file': TOOLS_DIR / 'questmapper.ts',
         'line': 69,
         'old': 'QuestLevel as level,',
         'new': 'qta.MaxLevel as level,',
         'note': 'Ensure LEFT JOIN quest_template_addon qta ON qt.ID = qta.ID exists'
     },
     {
-        'file': r'C:\TrinityBots\trinitycore-mcp\src\tools\questmapper.ts',
+        'file': TOOLS_DIR / 'questmapper.ts',
         'line': 388,
         'old': 'ORDER BY QuestLevel, ID',
         'new': 'ORDER BY qta.MaxLevel, qt.ID',
         'note': 'Ensure LEFT JOIN quest_template_addon qta ON qt.ID = qta.ID exists'
     },
     {
-        'file': r'C:\TrinityBots\trinitycore-mcp\src\tools\questmapper.ts',
+        'file': TOOLS_DIR / 'questmapper.ts',
         'line': 408,
         'old': 'ORDER BY QuestLevel, ID',
         'new': 'ORDER BY qta.MaxLevel, qt.ID',
         'note': 'Ensure LEFT JOIN quest_template_addon qta ON qt.ID = qta.ID exists'
     },
     {
-        'file': r'C:\TrinityBots\trinitycore-mcp\src\tools\questroute.ts',
+        'file': TOOLS_DIR / 'questroute.ts',
         'line': 489,
         'old': 'SELECT ID, QuestLevel, RewardXP, RewardMoney, RewardItem1, RewardItem2, RewardItem3, RewardItem4',
         'new': 'SELECT qt.ID, qta.MaxLevel as QuestLevel, qt.RewardXPDifficulty as RewardXP, qt.RewardMoney, qt.RewardItem1, qt.RewardItem2, qt.RewardItem3, qt.RewardItem4',
         'note': 'Need to add FROM quest_template qt LEFT JOIN quest_template_addon qta ON qt.ID = qta.ID'
     },
     {
-        'file': r'C:\TrinityBots\trinitycore-mcp\src\tools\zonedifficulty.ts',
+        'file': TOOLS_DIR / 'zonedifficulty.ts',
         'line': 220,
         'old': 'QuestLevel,',
         'new': 'qta.MaxLevel as QuestLevel,',
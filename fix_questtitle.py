@@ -1,17 +1,21 @@
 #!/usr/bin/env python3
+import re
 
-file_path = r'C:\TrinityBots\trinitycore-mcp\src\tools\questchain.ts'
+from scripts._editor import edit_text
+from scripts._paths import QUESTCHAIN_TS
 
-# Read file
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+file_path = QUESTCHAIN_TS
 
-# Replace all occurrences of QuestTitle with LogTitle
-original_count = content.count('QuestTitle')
-content = content.replace('QuestTitle', 'LogTitle')
+counts = []
 
-# Write back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
+def apply(content):
+    # subn returns the replacement count from the same traversal, so the
+    # separate content.count() pre-scan is gone
+    content, n = re.subn('QuestTitle', 'LogTitle', content)
+    counts.append(n)
+    return content
 
-print(f"SUCCESS: Replaced {original_count} occurrences of 'QuestTitle' with 'LogTitle'")
+if edit_text(file_path, apply):
+    print(f"SUCCESS: Replaced {counts[0]} occurrences of 'QuestTitle' with 'LogTitle'")
+else:
+    print("NO-OP: already applied, nothing to write")
@@ -7,37 +7,44 @@ This creates coordinate-based fallback detection for any zone with incorrect zon
 
 import re
 
-# Read the zone boundary data from MySQL output
-with open(r'C:\TrinityBots\all_zone_boundaries.txt', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+from scripts._paths import QUESTCHAIN_TS, ZONE_BOUNDARIES_DUMP
+
+# Stream the zone boundary data from MySQL output line by line rather than
+# materializing the whole file with readlines(). Each parsed row is a plain
+# (zone_id, map_id, quest_count, min_x, max_x, min_y, max_y) tuple — far
+# cheaper than a dict per row when there are thousands of zones.
+def _coord(text):
+    # MySQL usually dumps the coordinate columns as integer-looking strings;
+    # only pay for a float round trip when there really is a fraction
+    try:
+        return int(text)
+    except ValueError:
+        return int(float(text))
 
-# Parse zone data (skip header)
 zones = []
-for line in lines[1:]:
-    parts = line.strip().split('\t')
-    if len(parts) == 7:
-        zone_id = int(parts[0])
-        map_id = int(parts[1])
-        quest_count = int(parts[2])
-        min_x = int(float(parts[3]))
-        max_x = int(float(parts[4]))
-        min_y = int(float(parts[5]))
-        max_y = int(float(parts[6]))
-
-        zones.append({
-            'zoneId': zone_id,
-            'map': map_id,
-            'questCount': quest_count,
-            'minX': min_x,
-            'maxX': max_x,
-            'minY': min_y,
-            'maxY': max_y
-        })
+with open(ZONE_BOUNDARIES_DUMP, 'r', encoding='utf-8') as f:
+    next(f)  # skip header
+    for line in f:
+        # rstrip + bounded split: no leading-whitespace walk, and splitting
+        # stops once the seven expected fields are produced
+        parts = line.rstrip().split('\t', 6)
+        if len(parts) == 7:
+            zones.append((
+                int(parts[0]),      # zone_id
+                int(parts[1]),      # map_id
+                int(parts[2]),      # quest_count
+                _coord(parts[3]),   # min_x
+                _coord(parts[4]),   # max_x
+                _coord(parts[5]),   # min_y
+                _coord(parts[6]),   # max_y
+            ))
 
 print(f"Parsed {len(zones)} zones with quest data")
 
-# Generate TypeScript ZONE_BOUNDARIES configuration
-ts_config = """// ============================================================================
+# Generate TypeScript ZONE_BOUNDARIES configuration. Build it as a list of
+# parts joined once at the end — += on a growing string reallocates the whole
+# output per zone, which is O(n^2) in total characters copied.
+parts = ["""// ============================================================================
 // ZONE BOUNDARY DEFINITIONS
 // ============================================================================
 
@@ -60,36 +67,35 @@ interface ZoneBoundary {
 }
 
 const ZONE_BOUNDARIES: Record<string, ZoneBoundary> = {
-"""
+"""]
 
-# Add all zones with composite keys
-for zone in zones:
-    key = f"{zone['zoneId']}_{zone['map']}"
-    ts_config += f"  '{key}': {{ "
-    ts_config += f"zoneId: {zone['zoneId']}, "
-    ts_config += f"map: {zone['map']}, "
-    ts_config += f"minX: {zone['minX']}, "
-    ts_config += f"maxX: {zone['maxX']}, "
-    ts_config += f"minY: {zone['minY']}, "
-    ts_config += f"maxY: {zone['maxY']} "
-    ts_config += f"}}, // {zone['questCount']} quests\n"
+# Add all zones with composite keys — one f-string append per zone
+for zone_id, map_id, quest_count, min_x, max_x, min_y, max_y in zones:
+    parts.append(
+        f"  '{zone_id}_{map_id}': {{ "
+        f"zoneId: {zone_id}, map: {map_id}, "
+        f"minX: {min_x}, maxX: {max_x}, minY: {min_y}, maxY: {max_y} "
+        f"}}, // {quest_count} quests\n"
+    )
 
-ts_config += "};\n\n"""
+parts.append("};\n\n")
 
 # Add helper function to get all boundaries for a zone
-ts_config += """/**
+parts.append("""/**
  * Get all zone boundaries for a given zoneId (may span multiple maps)
  */
 function getZoneBoundaries(zoneId: number): ZoneBoundary[] {
   return Object.values(ZONE_BOUNDARIES).filter(b => b.zoneId === zoneId);
 }
 
-"""
+""")
+
+ts_config = ''.join(parts)
 
 print(f"Generated TypeScript configuration with {len(zones)} zone boundaries")
 
 # Read current questchain.ts file
-file_path = r'C:\TrinityBots\trinitycore-mcp\src\tools\questchain.ts'
+file_path = QUESTCHAIN_TS
 with open(file_path, 'r', encoding='utf-8') as f:
     content = f.read()
 
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+
+"""Shared in-memory patches for the zones API route and questchain.ts.
+
+fix_zones_and_chains.py, update_quest_chains.py, and update_zone_names.py all
+rewrite the same two files, so running them in sequence used to cost a full
+read+write round trip per script. The transforms live here as pure
+content -> content functions: a caller reads each file once, pipes the
+content through every relevant patch, and writes once. All transforms return
+the content unchanged when their fix is already applied, so edit_text skips
+the write entirely on warm re-runs.
+"""
+
+import json
+
+from scripts._paths import QUESTCHAIN_TS, ZONES_ROUTE_TS
+
+ROUTE_TS_PATH = ZONES_ROUTE_TS
+QUESTCHAIN_TS_PATH = QUESTCHAIN_TS
+
+
+def _splice_block(content, start_anchor, new_block, end_anchor='};'):
+    # Plain str.find splicing instead of a multi-kilobyte escaped regex
+    # matched against the whole file
+    start = content.find(start_anchor)
+    if start < 0:
+        return content
+    end = content.find(end_anchor, start)
+    if end < 0:
+        return content
+    end += len(end_anchor)
+    return content[:start] + new_block + content[end:]
+
+
+# ============================================================================
+# route.ts: comprehensive map names
+# ============================================================================
+
+# The comment line vanishes once the new block is in, so a missing anchor
+# means "already patched"
+MAP_NAMES_ANCHOR = '    // Add map names (well-known maps from WoW)'
+
+# Source-of-truth name tables. Python dicts collapse duplicate keys at
+# construction time, and json.dumps handles the quoting when the TS blocks
+# are emitted, so no manual apostrophe escaping is needed.
+MAP_NAMES = {
+    # Classic Continents
+    0: 'Eastern Kingdoms',
+    1: 'Kalimdor',
+
+    # Classic Dungeons & Raids
+    30: 'Alterac Valley',
+    33: 'Shadowfang Keep',
+    34: 'The Stockade',
+    36: 'Deadmines',
+    43: 'Wailing Caverns',
+    47: 'Razorfen Kraul',
+    48: 'Blackfathom Deeps',
+    70: 'Uldaman',
+    90: 'Gnomeregan',
+    109: 'Sunken Temple',
+    129: 'Razorfen Downs',
+    189: 'Scarlet Monastery',
+    209: "Zul'Farrak",
+    229: 'Blackrock Spire',
+    230: 'Blackrock Depths',
+    249: "Onyxia's Lair",
+    269: 'Black Morass',
+    289: 'Scholomance',
+    309: "Zul'Gurub",
+    329: 'Stratholme',
+    349: 'Maraudon',
+    389: 'Ragefire Chasm',
+    409: 'Molten Core',
+    429: 'Dire Maul',
+    469: 'Blackwing Lair',
+    509: "Ruins of Ahn'Qiraj",
+    531: "Ahn'Qiraj Temple",
+    533: 'Naxxramas',
+
+    # Burning Crusade
+    530: 'Outland',
+    532: 'Karazhan',
+    534: 'The Battle for Mount Hyjal',
+    540: 'Shattered Halls',
+    542: 'Blood Furnace',
+    543: 'Hellfire Ramparts',
+    544: "Magtheridon's Lair",
+    545: 'The Steamvault',
+    546: 'The Underbog',
+    547: 'The Slave Pens',
+    548: 'Serpentshrine Cavern',
+    550: 'Tempest Keep',
+    552: 'The Arcatraz',
+    553: 'The Botanica',
+    554: 'The Mechanar',
+    555: 'Shadow Labyrinth',
+    556: 'Sethekk Halls',
+    557: 'Mana-Tombs',
+    558: 'Auchenai Crypts',
+    560: 'Old Hillsbrad Foothills',
+    564: 'Black Temple',
+    565: "Gruul's Lair",
+    568: "Zul'Aman",
+    580: 'Sunwell Plateau',
+    585: "Magisters' Terrace",
+
+    # Wrath of the Lich King
+    571: 'Northrend',
+    574: 'Utgarde Keep',
+    575: 'Utgarde Pinnacle',
+    576: 'The Nexus',
+    578: 'The Oculus',
+    599: 'Halls of Stone',
+    600: "Drak'Tharon Keep",
+    601: 'Azjol-Nerub',
+    602: 'Halls of Lightning',
+    603: 'Ulduar',
+    604: 'Gundrak',
+    608: 'Violet Hold',
+    609: 'Ebon Hold',
+    615: 'The Obsidian Sanctum',
+    616: 'The Eye of Eternity',
+    619: "Ahn'kahet: The Old Kingdom",
+    624: 'Vault of Archavon',
+    628: 'Isle of Conquest',
+    631: 'Icecrown Citadel',
+    632: 'The Forge of Souls',
+    649: 'Trial of the Crusader',
+    650: 'Trial of the Champion',
+    658: 'Pit of Saron',
+    668: 'Halls of Reflection',
+    724: 'The Ruby Sanctum',
+}
+
+ZONE_NAMES = {
+    # Eastern Kingdoms - Alliance Starting Zones
+    1: 'Dun Morogh',
+    12: 'Elwynn Forest',
+    38: 'Loch Modan',
+    40: 'Westfall',
+    44: 'Redridge Mountains',
+    51: 'Searing Gorge',
+
+    # Eastern Kingdoms - Horde Starting Zones
+    14: 'Durotar',
+    85: 'Tirisfal Glades',
+    130: 'Silverpine Forest',
+
+    # Eastern Kingdoms - Mid-Level Zones
+    3: 'Badlands',
+    4: 'Blasted Lands',
+    8: 'Swamp of Sorrows',
+    10: 'Duskwood',
+    11: 'Wetlands',
+    23: 'Burning Steppes',
+    28: 'Western Plaguelands',
+    33: 'Stranglethorn Vale',
+    36: 'Alterac Mountains',
+    45: 'Arathi Highlands',
+    47: 'The Hinterlands',
+    139: 'Eastern Plaguelands',
+    267: 'Hillsbrad Foothills',
+
+    # Cities
+    1519: 'Stormwind City',
+    1537: 'Ironforge',
+    1657: 'Darnassus',
+    1497: 'Undercity',
+    1638: 'Orgrimmar',
+    1637: 'Thunder Bluff',
+    3487: 'Silvermoon City',
+    3557: 'The Exodar',
+
+    # Kalimdor - Alliance Starting Zones
+    141: 'Teldrassil',
+    148: 'Darkshore',
+    3524: 'Azuremyst Isle',
+    3525: 'Bloodmyst Isle',
+
+    # Kalimdor - Horde Starting Zones
+    215: 'Mulgore',
+
+    # Kalimdor - Mid-Level Zones
+    331: 'Ashenvale',
+    357: 'Feralas',
+    361: 'Felwood',
+    400: 'Thousand Needles',
+    405: 'Desolace',
+    406: 'Stonetalon Mountains',
+    440: 'Tanaris',
+    490: "Un'Goro Crater",
+    493: 'Moonglade',
+    618: 'Winterspring',
+    1377: 'Silithus',
+    2597: 'Alterac Valley',
+    3430: 'Eversong Woods',
+    3433: 'Ghostlands',
+
+    # Outland Zones (TBC)
+    3483: 'Hellfire Peninsula',
+    3518: 'Nagrand',
+    3519: 'Terokkar Forest',
+    3520: 'Shadowmoon Valley',
+    3521: 'Zangarmarsh',
+    3522: "Blade's Edge Mountains",
+    3523: 'Netherstorm',
+
+    # Northrend Zones (Wrath)
+    65: 'Dragonblight',
+    66: "Zul'Drak",
+    67: 'The Storm Peaks',
+    210: 'Icecrown',
+    394: 'Grizzly Hills',
+    495: 'Howling Fjord',
+    3537: 'Borean Tundra',
+    4197: 'Wintergrasp',
+    4395: 'Dalaran',
+    4742: "Hrothgar's Landing",
+
+    # Special Zones
+    616: 'Mount Hyjal',
+    2817: 'Crystalsong Forest',
+    4080: "Isle of Quel'Danas",
+}
+
+
+def _ts_record(names):
+    # json.dumps produces valid TS string literals, so apostrophes never
+    # need hand escaping here
+    return '\n'.join(
+        f'      {key}: {json.dumps(name)},' for key, name in sorted(names.items())
+    )
+
+
+NEW_MAP_NAMES = (
+    '    // Comprehensive map names from WoW (Classic through Wrath)\n'
+    '    const knownMapNames: Record<number, string> = {\n'
+    + _ts_record(MAP_NAMES) +
+    '\n    };'
+)
+
+
+def patch_map_names(content):
+    return _splice_block(content, MAP_NAMES_ANCHOR, NEW_MAP_NAMES)
+
+
+# ============================================================================
+# route.ts: comprehensive zone names
+# ============================================================================
+
+ZONE_NAMES_ANCHOR = '    const knownZoneNames: Record<number, string> = {'
+
+NEW_ZONE_NAMES = (
+    '    // Comprehensive zone names from WoW (Classic through Wrath)\n'
+    '    const knownZoneNames: Record<number, string> = {\n'
+    + _ts_record(ZONE_NAMES) +
+    '\n    };'
+)
+
+
+def patch_zone_names(content):
+    # Operate on the raw string: locate the knownZoneNames declaration and
+    # the closing brace with str.find and splice once, instead of
+    # materializing a line list and rescanning it
+    start = content.find(ZONE_NAMES_ANCHOR)
+    if start < 0:
+        return content
+    end = content.find('};', start)
+    if end < 0:
+        return content
+    end += 2
+
+    # Take the comment introducing the old block with it, otherwise each
+    # run would stack a fresh comment line above the declaration
+    prev_nl = content.rfind('\n', 0, start)
+    if prev_nl >= 0:
+        prev_start = content.rfind('\n', 0, prev_nl) + 1
+        if content[prev_start:prev_nl].lstrip().startswith('//'):
+            start = prev_start
+
+    return content[:start] + NEW_ZONE_NAMES + content[end:]
+
+
+# ============================================================================
+# questchain.ts: findQuestChainsInZone rewrite
+# ============================================================================
+
+# The old function body carries this clause; it is gone after the rewrite,
+# so it doubles as the idempotency marker
+OLD_CHAIN_MARKER = 'AND qta.NextQuestID IS NOT NULL'
+CHAIN_FN_ANCHOR = 'export async function findQuestChainsInZone(zoneId: number): Promise<QuestChain[]> {'
+
+NEW_CHAIN_FUNCTION = '''export async function findQuestChainsInZone(zoneId: number): Promise<QuestChain[]> {
+  // Find all quests in zone that are potential chain starters or part of chains
+  // Don't require NextQuestID since many chains only use PrevQuestID
+  const query = `
+    SELECT DISTINCT qt.ID
+    FROM quest_template qt
+    LEFT JOIN quest_template_addon qta ON qt.ID = qta.ID
+    INNER JOIN creature_queststarter cqs ON qt.ID = cqs.quest
+    INNER JOIN creature c ON cqs.id = c.id
+    WHERE c.zoneId = ?
+      AND (qta.PrevQuestID = 0 OR qta.PrevQuestID IS NULL)
+    LIMIT 100
+  `;
+
+  const starters = await queryWorld(query, [zoneId]);
+
+  const chains: QuestChain[] = [];
+  const processedChainIds = new Set<string>();
+
+  for (const starter of starters) {
+    try {
+      const chain = await traceQuestChain(starter.ID);
+
+      // Create unique chain ID to avoid duplicates
+      const chainId = chain.quests.map(q => q.questId).sort().join('-');
+
+      if (!processedChainIds.has(chainId)) {
+        processedChainIds.add(chainId);
+        // Include all quests, even standalone ones (totalQuests >= 1)
+        chains.push(chain);
+      }
+    } catch (error) {
+      // Skip invalid chains
+      continue;
+    }
+  }
+
+  return chains.sort((a, b) => b.totalQuests - a.totalQuests);
+}'''
+
+
+def _function_end(content, start):
+    # One-pass brace-depth scan from the function's opening line. TypeScript
+    # braces are balanced, so the function ends on the line where the running
+    # depth returns to zero — no dependence on the exact text of the last
+    # statement, and O(n) instead of rescanning the body per line.
+    depth = 0
+    pos = start
+    size = len(content)
+    while pos < size:
+        nl = content.find('\n', pos)
+        if nl < 0:
+            nl = size
+        line = content[pos:nl]
+        depth += line.count('{') - line.count('}')
+        if depth <= 0:
+            return nl
+        pos = nl + 1
+    return -1
+
+
+def patch_chain_function(content):
+    if OLD_CHAIN_MARKER not in content:
+        return content
+    start = content.find(CHAIN_FN_ANCHOR)
+    if start < 0:
+        return content
+    end = _function_end(content, start)
+    if end < 0:
+        return content
+    return content[:start] + NEW_CHAIN_FUNCTION + content[end:]
+
+
+# ============================================================================
+# Fused per-file pipelines
+# ============================================================================
+
+def patch_route_ts(content):
+    content = patch_map_names(content)
+    return patch_zone_names(content)
+
+
+def patch_questchain_ts(content):
+    return patch_chain_function(content)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Shared file-editing helpers for the one-shot fix_*.py / add_*.py scripts."""
+
+import os
+import re
+from pathlib import Path
+
+try:
+    import ahocorasick
+except ImportError:  # optional fast path; the regex fallback is always there
+    ahocorasick = None
+
+
+def multi_replace(content, table):
+    """Replace every key of table with its value in a single pass.
+
+    Uses a pyahocorasick automaton when the package is installed (O(N+M+Z)
+    multi-pattern matching); otherwise falls back to one fused regex
+    alternation with keys sorted longest-first to avoid prefix collisions.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for key, value in table.items():
+            automaton.add_word(key, (key, value))
+        automaton.make_automaton()
+
+        parts = []
+        last = 0
+        for end, (key, value) in automaton.iter(content):
+            start = end - len(key) + 1
+            if start < last:
+                continue  # overlaps a replacement already emitted
+            parts.append(content[last:start])
+            parts.append(value)
+            last = end + 1
+        parts.append(content[last:])
+        return ''.join(parts)
+
+    pattern = re.compile('|'.join(
+        re.escape(k) for k in sorted(table, key=len, reverse=True)
+    ))
+    return pattern.sub(lambda m: table[m.group(0)], content)
+
+
+def atomic_write_bytes(path, data):
+    """Write data to path atomically.
+
+    Writes the whole buffer to a temp file in one unbuffered call, then
+    os.replace()s it over the target so a crash mid-write never leaves a
+    truncated source file behind.
+    """
+    tmp = str(path) + '.tmp'
+    with open(tmp, 'wb', buffering=0) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def atomic_write_text(path, content):
+    """Encode once and write content to path atomically."""
+    atomic_write_bytes(path, content.encode('utf-8'))
+
+
+def edit_bytes(path, transform):
+    """Apply transform (bytes -> bytes) to the file at path.
+
+    Reads the whole file in one call and writes back atomically, but only
+    when the transform actually changed something, so no-op re-runs never
+    touch mtime or trigger watcher rebuilds. Returns True when the file was
+    rewritten.
+    """
+    data = Path(path).read_bytes()
+    new = transform(data)
+    if new == data:
+        return False
+    atomic_write_bytes(path, new)
+    return True
+
+
+def edit_text(path, transform):
+    """Apply transform (str -> str) to the UTF-8 file at path.
+
+    Same contract as edit_bytes, decoding/encoding exactly once at the
+    edges. Returns True when the file was rewritten.
+    """
+    return edit_bytes(
+        path, lambda data: transform(data.decode('utf-8')).encode('utf-8')
+    )
@@ -0,0 +1,23 @@
+"""Path constants shared by the one-shot maintenance scripts.
+
+Every script used to hardcode the same absolute Windows paths inline and
+re-resolve them on each invocation. They are built once here as pathlib
+Paths, and the installation root can be pointed elsewhere through the
+MCP_ROOT environment variable.
+"""
+
+import os
+from pathlib import Path
+
+MCP_ROOT = Path(os.environ.get('MCP_ROOT', r'C:\TrinityBots\trinitycore-mcp'))
+
+SRC_DIR = MCP_ROOT / 'src'
+TOOLS_DIR = SRC_DIR / 'tools'
+
+QUESTCHAIN_TS = TOOLS_DIR / 'questchain.ts'
+ZONES_ROUTE_TS = MCP_ROOT / 'web-ui' / 'app' / 'api' / 'zones' / 'route.ts'
+QUEST_CHAINS_PAGE_TSX = MCP_ROOT / 'web-ui' / 'app' / 'quest-chains' / 'page.tsx'
+
+# MySQL dump consumed by generate_all_zone_boundaries.py; lives next to the
+# checkout rather than inside it
+ZONE_BOUNDARIES_DUMP = MCP_ROOT.parent / 'all_zone_boundaries.txt'
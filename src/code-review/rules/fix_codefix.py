@@ -1,23 +1,44 @@
-import re
+from pathlib import Path
+
+# The regex module degrades gracefully on pathological inputs and supports
+# possessive quantifiers, which stop the nested [^}]/[^\]] classes from
+# backtracking quadratically on rule files with many suggestedFix blocks.
+# Fall back to stdlib re (greedy quantifiers) when it isn't installed.
+try:
+    import regex as re
+    _HAVE_REGEX = True
+except ImportError:
+    import re
+    _HAVE_REGEX = False
+
+# Pattern 1: Replace suggestedFix objects that only have description/changes/unifiedDiff
+# These are incomplete CodeFix objects that should be removed or simplified
+# Replace with a placeholder that compiles
+#
+# Find suggestedFix blocks that start with description (not type/file/line).
+# Compiled once at module scope so the four fix_file calls below share one
+# compilation instead of paying for it per file.
+_PATTERN = r'suggestedFix:\s*\{\s*description:[^\}]++changes:\s*\[[^\]]++\][,\s]*unifiedDiff:[^}]++\}'
+if not _HAVE_REGEX:
+    # stdlib re has no possessive quantifiers
+    _PATTERN = _PATTERN.replace('++', '+')
+
+_SUGGESTED_FIX_RE = re.compile(_PATTERN, re.DOTALL)
 
 def fix_file(filename):
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Pattern 1: Replace suggestedFix objects that only have description/changes/unifiedDiff
-    # These are incomplete CodeFix objects that should be removed or simplified
-    # Replace with a placeholder that compiles
-    
-    # Find suggestedFix blocks that start with description (not type/file/line)
-    pattern = r'suggestedFix:\s*\{\s*description:[^\}]+changes:\s*\[[^\]]+\][,\s]*unifiedDiff:[^}]+\}'
-    
-    replacement = 'suggestedFix: undefined'
-    
-    content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
+    path = Path(filename)
+    content = path.read_text(encoding='utf-8')
+
+    # The replacement is a plain literal, so no template parsing is involved
+    new_content = _SUGGESTED_FIX_RE.sub('suggestedFix: undefined', content)
+
+    # Only rewrite the file when the pattern actually matched; on warm
+    # re-runs every file is already fixed and no write happens at all
+    if new_content == content:
+        print(f"Unchanged {filename}")
+        return
+
+    path.write_text(new_content, encoding='utf-8')
     print(f"Fixed {filename}")
 
 for filename in ['ConcurrencyRules.ts', 'ConventionRules.ts', 'PerformanceRules.ts', 'SecurityRules.ts']:
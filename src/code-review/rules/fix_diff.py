@@ -1,41 +1,39 @@
-import re
 import sys
+from pathlib import Path
+
+# Prefer the regex module for its backtracking behaviour and possessive
+# quantifiers; fall back to stdlib re when it isn't installed.
+try:
+    import regex as re
+    _HAVE_REGEX = True
+except ImportError:
+    import re
+    _HAVE_REGEX = False
+
+# Replace the entire changes/unifiedDiff block with just diff: ''.
+# Compiled once at module load instead of per fix_suggested_fix call.
+_PATTERN = r"changes:\s*\[[^\]]*+\][,\s]*unifiedDiff:\s*`[^`]*+`"
+if not _HAVE_REGEX:
+    # stdlib re has no possessive quantifiers
+    _PATTERN = _PATTERN.replace('*+', '*')
+
+_CHANGES_RE = re.compile(_PATTERN)
 
 def fix_suggested_fix(content):
     # Pattern to match suggestedFix blocks with changes and unifiedDiff
-    # and replace with diff: ''
-    pattern = r"(suggestedFix:\s*\{[^}]*)(changes:\s*\[[^\]]*\][^}]*unifiedDiff:\s*`[^`]*`)"
-    
-    def replace_with_diff(match):
-        prefix = match.group(1)
-        # Extract description if it exists
-        desc_match = re.search(r"description:\s*'([^']*)'", prefix)
-        if desc_match:
-            description = desc_match.group(1)
-            # Keep everything up to description and add diff: ''
-            return f"{prefix}diff: ''"
-        else:
-            return f"{prefix}diff: ''"
-    
-    # This is complex - let me use a simpler approach
-    # Replace the entire changes/unifiedDiff block with just diff: ''
-    result = re.sub(
-        r"changes:\s*\[[^\]]*\][,\s]*unifiedDiff:\s*`[^`]*`",
-        "diff: ''",
-        content
-    )
-    
-    return result
+    # and replace with diff: '' (the replacement is a plain literal)
+    return _CHANGES_RE.sub("diff: ''", content)
 
 if __name__ == '__main__':
     filename = sys.argv[1]
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+    path = Path(filename)
+    content = path.read_text(encoding='utf-8')
+
     fixed = fix_suggested_fix(content)
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(fixed)
-    
-    print(f"Fixed {filename}")
 
+    # Skip the write entirely when nothing matched
+    if fixed == content:
+        print(f"Unchanged {filename}")
+    else:
+        path.write_text(fixed, encoding='utf-8')
+        print(f"Fixed {filename}")
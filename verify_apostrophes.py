@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 import re
+from scripts._paths import ZONES_ROUTE_TS
 
-file_path = r'C:\TrinityBots\trinitycore-mcp\web-ui\app\api\zones\route.ts'
+file_path = ZONES_ROUTE_TS
+
+# Compiled once instead of per line inside the scan loop
+_LINE_RE = re.compile(r'\s+\d+:')
+_NAME_RE = re.compile(r": '([^']*(?:\\'[^']*)*)',")
 
 # Read file
 with open(file_path, 'r', encoding='utf-8') as f:
@@ -11,41 +16,38 @@ print("Scanning for unescaped apostrophes in zone/map names...\n")
 
 issues_found = []
 
-# Check lines in the knownMapNames and knownZoneNames sections
-in_map_names = False
-in_zone_names = False
+# Track which dict we are inside with a single state variable; the data-line
+# path comes first so lines inside a section skip the transition checks
+section = None  # None | 'knownMapNames' | 'knownZoneNames'
 
 for i, line in enumerate(lines, 1):
+    if section is not None:
+        # Hot path: entry lines start with a digit after the indentation —
+        # cheap reject before touching the regex engine
+        if line.lstrip()[:1].isdigit():
+            if _LINE_RE.match(line):
+                # Extract the string value
+                match = _NAME_RE.search(line)
+                if match:
+                    name = match.group(1)
+                    # Strip the escaped apostrophes in one pass; any quote
+                    # left over is unescaped
+                    if "'" in name.replace("\\'", ""):
+                        issues_found.append({
+                            'line': i,
+                            'text': line.strip(),
+                            'name': name,
+                            'section': section
+                        })
+            continue
+        if '};' in line:
+            section = None
+            continue
+
     if 'const knownMapNames' in line:
-        in_map_names = True
-        in_zone_names = False
-        continue
+        section = 'knownMapNames'
     elif 'const knownZoneNames' in line:
-        in_zone_names = True
-        in_map_names = False
-        continue
-    elif in_map_names and '};' in line:
-        in_map_names = False
-    elif in_zone_names and '};' in line:
-        in_zone_names = False
-
-    if (in_map_names or in_zone_names) and re.match(r'\s+\d+:', line):
-        # Extract the string value
-        match = re.search(r": '([^']*(?:\\'[^']*)*)',", line)
-        if match:
-            name = match.group(1)
-            # Check for unescaped apostrophes (apostrophes not preceded by backslash)
-            # Split by \' to get segments, then check each segment for apostrophes
-            segments = name.split("\\'")
-            for seg_idx, segment in enumerate(segments):
-                if "'" in segment:
-                    issues_found.append({
-                        'line': i,
-                        'text': line.strip(),
-                        'name': name,
-                        'section': 'knownMapNames' if in_map_names else 'knownZoneNames'
-                    })
-                    break
+        section = 'knownZoneNames'
 
 if issues_found:
     print(f"❌ Found {len(issues_found)} unescaped apostrophes:\n")
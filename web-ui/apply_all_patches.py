@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""Apply every pending quest-chains page patch in one read/write cycle.
+
+add_map_selector.py and fix_quest_chains_page.py each used to open, scan and
+rewrite the same page.tsx. The transforms live here as pure
+bytes -> bytes functions so the file is read once, piped through both
+patches in memory, and written once; the original scripts remain as thin
+wrappers. Every transform returns the content unchanged when its fix is
+already in place, so re-runs write nothing.
+"""
+
+import mmap
+import sys
+from pathlib import Path
+
+import patch_utils
+
+PAGE_TSX = Path(r'C:\TrinityBots\trinitycore-mcp\web-ui\app\quest-chains\page.tsx')
+
+
+# ============================================================================
+# Map selector insertion
+# ============================================================================
+
+# Replacement block for the Zone Selector section, with a Map selector added.
+# All anchors and replacement blocks are module-level bytes constants so the
+# pipeline stays byte-oriented end-to-end: nothing is encoded or decoded per
+# run, and the same constants serve both the mmap probes and the patching.
+NEW_SECTION = b'''        {/* Map, Zone Selector and Search */}
+        <div className="mb-6 grid grid-cols-1 md:grid-cols-2 gap-4">
+          <div className="bg-slate-800/50 backdrop-blur border border-slate-700 rounded-lg p-4 space-y-4">
+            <div>
+              <label className="text-sm font-semibold text-white mb-2 block">Select Map</label>
+              {loadingZones ? (
+                <div className="flex items-center gap-2 text-slate-400">
+                  <Loader2 className="w-4 h-4 animate-spin" />
+                  Loading maps...
+                </div>
+              ) : (
+                <Select onValueChange={handleMapChange} value={selectedMap}>
+                  <SelectTrigger>
+                    <SelectValue placeholder="Choose a map..." />
+                  </SelectTrigger>
+                  <SelectContent>
+                    {maps.map((map) => (
+                      <SelectItem key={map.id} value={map.id.toString()}>
+                        {map.name} ({map.zoneCount} zones)
+                      </SelectItem>
+                    ))}
+                  </SelectContent>
+                </Select>
+              )}
+            </div>
+
+            <div>
+              <label className="text-sm font-semibold text-white mb-2 block">Select Zone</label>
+              {loadingZones ? (
+                <div className="flex items-center gap-2 text-slate-400">
+                  <Loader2 className="w-4 h-4 animate-spin" />
+                  Loading zones...
+                </div>
+              ) : (
+                <Select onValueChange={handleZoneChange} value={selectedZone} disabled={!selectedMap}>
+                  <SelectTrigger>
+                    <SelectValue placeholder={!selectedMap ? "First select a map..." : "Choose a zone..."} />
+                  </SelectTrigger>
+                  <SelectContent>
+                    {filteredZones.map((zone) => (
+                      <SelectItem key={zone.id} value={zone.id.toString()}>
+                        {zone.name} ({zone.questCount} quests)
+                      </SelectItem>
+                    ))}
+                  </SelectContent>
+                </Select>
+              )}
+            </div>
+          </div>'''
+
+# Anchor literals bounding the block to replace. A missing start anchor (or
+# the presence of the new markers) means the selector is already in place.
+# The card end is located by walking the ordered anchors below with
+# successive find() calls, so indentation or attribute changes between them
+# do not break the match the way an exact multi-line literal would.
+START = b'        {/* Zone Selector and Search */}'
+_CARD_END_ANCHORS = (b'<label', b'Select Zone', b'</Select>', b'</div>')
+
+
+def patch_add_map_selector(content):
+    if b'Select Map' in content and b'First select a map...' in content:
+        return content
+    idx = content.find(START)
+    if idx < 0:
+        return content
+    pos = idx
+    for anchor in _CARD_END_ANCHORS:
+        pos = content.find(anchor, pos)
+        if pos < 0:
+            sys.exit('ERROR: zone selector card structure not found - has page.tsx changed?')
+        pos += len(anchor)
+    # pos now sits just past the closing </div> of the zone selector card
+    return content[:idx] + NEW_SECTION + content[pos:]
+
+
+# ============================================================================
+# Squashed-code formatting fixes
+# ============================================================================
+
+# The reformatted handleMapChange only exists once the fixes have run, so it
+# doubles as the already-applied marker
+APPLIED_MARKER = b"const handleMapChange = (mapId: string) => {\n    setSelectedMap"
+
+# Both targets are plain literals, so bytes.replace covers them without the
+# regex engine; each block occurs once, so replacement stops at the first hit
+OLD_209 = b"const handleMapChange = (mapId: string) => {    setSelectedMap(mapId);    setSelectedZone('); // Reset zone when map changes  };  // Filter zones by selected map  const filteredZones = useMemo(() => {    if (!selectedMap) return zones;    return zones.filter(zone => zone.mapId.toString() === selectedMap);  }, [zones, selectedMap]);"
+
+NEW_209 = b"""const handleMapChange = (mapId: string) => {
+    setSelectedMap(mapId);
+    setSelectedZone(''); // Reset zone when map changes
+  };
+
+  // Filter zones by selected map
+  const filteredZones = useMemo(() => {
+    if (!selectedMap) return zones;
+    return zones.filter(zone => zone.mapId.toString() === selectedMap);
+  }, [zones, selectedMap]);"""
+
+OLD_213 = b"      // Extract zoneId from composite key \"mapId-zoneId\"      const zoneIdNum = parseInt(zoneId.split('-')[1]);      fetchQuestChainsInZone(zoneIdNum);"
+
+NEW_213 = b"""      // Extract zoneId from composite key "mapId-zoneId"
+      const zoneIdNum = parseInt(zoneId.split('-')[1]);
+      fetchQuestChainsInZone(zoneIdNum);"""
+
+
+def _replace_once(content, old, new, what):
+    # str.replace analog of re.subn's count check: if the sentinel promised a
+    # match but the full literal is not there, the file has drifted — fail
+    # loudly instead of printing success and writing nothing
+    new_content = content.replace(old, new, 1)
+    if new_content == content:
+        sys.exit(f"ERROR: {what} block not found - has page.tsx changed?")
+    return new_content
+
+
+def patch_fix_syntax(content):
+    if APPLIED_MARKER in content:
+        return content
+    # Short sentinel checks reject files that do not contain the squashed
+    # blocks before the full-length literals are searched
+    if b'const handleMapChange' in content:
+        content = _replace_once(content, OLD_209, NEW_209, 'handleMapChange')
+    if b'// Extract zoneId from composite key' in content:
+        content = _replace_once(content, OLD_213, NEW_213, 'zone extraction')
+    return content
+
+
+def patch(content):
+    # The fused pipeline: both transforms chained on the in-memory bytes, so
+    # a caller needs one read, one patch call and one write. The edits touch
+    # disjoint regions, so the order is immaterial.
+    return patch_fix_syntax(patch_add_map_selector(content))
+
+
+def load_page():
+    return patch_utils.load(PAGE_TSX)
+
+
+def save_page(content):
+    return patch_utils.save_if_dirty(PAGE_TSX, content)
+
+
+def main():
+    # Memory-map the file and probe the anchors directly on the mapping: a
+    # warm re-run exits on two mm.find calls served from the page cache,
+    # without decoding (or even copying) the file contents
+    with open(PAGE_TSX, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            needs_selector = mm.find(START) >= 0
+            needs_syntax = mm.find(APPLIED_MARKER) < 0
+            if not needs_selector and not needs_syntax:
+                print("page.tsx already up to date, nothing to write")
+                return
+
+    if save_page(patch(load_page())):
+        print("Patched quest-chains/page.tsx (map selector + syntax fixes)")
+    else:
+        print("page.tsx already up to date, nothing to write")
+
+
+if __name__ == '__main__':
+    main()
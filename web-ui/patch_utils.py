@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+"""Shared cached file I/O for the quest-chains page patch scripts.
+
+When several patch scripts run in one interpreter (or one script applies
+several transforms), the target file should hit the disk once on the way in
+and at most once on the way out. load() memoizes the decoded contents per
+path and save_if_dirty() skips the write entirely when nothing changed.
+"""
+
+import functools
+import os
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=8)
+def load(path):
+    # Raw bytes, no decode or newline translation: the patch functions work
+    # on bytes end-to-end, so the file contents never leave UTF-8
+    return Path(path).read_bytes()
+
+
+def save_if_dirty(path, content):
+    """Write content bytes back only if they differ from what was loaded.
+
+    Returns True when the file was written, False when it was already up to
+    date. Both buffers are in memory, so a direct comparison against the
+    cached original is the cheapest dirty check. The cache is invalidated
+    after a write so a later load() sees the new contents.
+    """
+    if content == load(path):
+        return False
+    # Write the full contents to a sibling temp file in one sequential burst,
+    # then rename over the target: an interrupted run leaves the original
+    # page.tsx intact instead of a truncated file. CRLF endings survive
+    # exactly as read.
+    tmp = Path(str(path) + '.tmp')
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+    load.cache_clear()
+    return True